@@ -3,14 +3,18 @@
 """
 
 import asyncio
+import re
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from wpg_engine.core.rag_system import RAGSystem
 from wpg_engine.models import Country, Game
 from wpg_engine.models.base import Base
 
+# Временная база данных в памяти и фабрика сессий для демонстрации
+engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+async_session = async_sessionmaker(engine, expire_on_commit=False)
+
 
 async def create_demo_data(session: AsyncSession):
     """Создать демонстрационные данные"""
@@ -86,34 +90,48 @@ async def create_demo_data(session: AsyncSession):
         },
     ]
 
-    for country_data in countries_data:
-        country = Country(
-            game_id=game.id,
-            name=country_data["name"],
-            capital=country_data["capital"],
-            population=country_data["population"],
-            synonyms=country_data["synonyms"],
-            **country_data["aspects"],
-        )
-        session.add(country)
+    # Добавить все страны одним пакетом
+    session.add_all(
+        [
+            Country(
+                game_id=game.id,
+                name=country_data["name"],
+                capital=country_data["capital"],
+                population=country_data["population"],
+                synonyms=country_data["synonyms"],
+                **country_data["aspects"],
+            )
+            for country_data in countries_data
+        ]
+    )
 
     await session.commit()
     return game.id
 
 
+def build_country_patterns(countries_data: list[dict]) -> list[tuple[dict, re.Pattern]]:
+    """Скомпилировать для каждой страны шаблон из её названия и синонимов"""
+    # Каждая страна проверяется своим шаблоном, поэтому находятся и страны,
+    # чьё название встречается внутри синонима другой страны
+    return [
+        (
+            country,
+            re.compile(
+                "|".join(map(re.escape, (country["name"], *country["synonyms"]))),
+                re.IGNORECASE,
+            ),
+        )
+        for country in countries_data
+    ]
+
+
 async def demo_rag_analysis():
     """Демонстрация анализа RAG системы"""
 
-    # Создать временную базу данных в памяти
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-
     # Создать таблицы
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    # Создать сессию
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
     async with async_session() as session:
         # Создать демонстрационные данные
         game_id = await create_demo_data(session)
@@ -135,6 +153,9 @@ async def demo_rag_analysis():
         print("🤖 Демонстрация RAG системы для админа\n")
         print("=" * 60)
 
+        # Шаблоны стран для резервного поиска (строятся при первой необходимости)
+        country_patterns = None
+
         for i, test_case in enumerate(test_messages, 1):
             print(f"\n📝 Тест {i}:")
             print(f"Отправитель: {test_case['sender']}")
@@ -154,12 +175,13 @@ async def demo_rag_analysis():
 
                 # Показать альтернативную информацию
                 print("📊 Базовая информация о странах:")
-                countries_data = await rag_system._get_all_countries_data(game_id)
-                for country in countries_data:
-                    if country["name"].lower() in test_case["message"].lower() or any(
-                        syn.lower() in test_case["message"].lower()
-                        for syn in country["synonyms"]
-                    ):
+                if country_patterns is None:
+                    country_patterns = build_country_patterns(
+                        await rag_system._get_all_countries_data(game_id)
+                    )
+
+                for country, pattern in country_patterns:
+                    if pattern.search(test_case["message"]):
                         print(
                             f"  🏛️ {country['name']}: Военное дело {country['aspects']['military']}/10, "
                             f"Экономика {country['aspects']['economy']}/10"
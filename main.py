@@ -5,40 +5,37 @@ Handles database initialization and startup
 """
 
 import asyncio
+import importlib
 import logging
+import pkgutil
 import sys
 
+from sqlalchemy import select
+
 from wpg_engine.adapters.telegram.bot import main as bot_main
 from wpg_engine.core.engine import GameEngine
-from wpg_engine.models import get_db, init_db
+from wpg_engine.models import Game, get_db, init_db
+
+try:
+    import uvloop
+except ImportError:  # optional, not available on Windows
+    uvloop = None
 
 
 async def check_and_init_database():
     """Check if database exists and initialize if needed"""
     print("🔍 Checking database...")
 
-    try:
-        # Try to get database session to check if it exists and is accessible
-        async with get_db() as db:
-            # Try to query something simple to check if tables exist
-            from sqlalchemy import select
+    # init_db reads the schema once and creates only the missing tables
+    # (note: bot.py will also init, but this is idempotent)
+    created_tables = await init_db()
 
-            from wpg_engine.models.game import Game
-
-            try:
-                await db.execute(select(Game).limit(1))
-                print("✅ Database exists and is accessible")
-                return True
-            except Exception:
-                # Tables don't exist, need to initialize
-                print("📊 Database exists but tables missing, initializing...")
-    except Exception as e:
-        print(f"📊 Database not accessible: {e}")
-        print("📊 Initializing database...")
+    if "games" not in created_tables:
+        if created_tables:
+            print(f"📊 Created missing tables: {', '.join(created_tables)}")
+        print("✅ Database exists and is accessible")
+        return True
 
-    # Initialize database (note: bot.py will also init, but this is idempotent)
-    # We keep it here for standalone scripts that don't use bot.py
-    await init_db()
     print("✅ Database initialized")
     return False
 
@@ -49,15 +46,10 @@ async def create_initial_game_if_needed():
         engine = GameEngine(db)
 
         # Check if any games exist
-        from sqlalchemy import select
-
-        from wpg_engine.models.game import Game
-
-        result = await db.execute(select(Game).limit(1))
-        existing_game = result.scalar_one_or_none()
+        existing_game_name = await db.scalar(select(Game.name).limit(1))
 
-        if existing_game:
-            print(f"✅ Game already exists: {existing_game.name}")
+        if existing_game_name:
+            print(f"✅ Game already exists: {existing_game_name}")
             return
 
         print("🎮 No games found, creating initial game...")
@@ -87,41 +79,30 @@ async def run_migrations():
     print("🔄 Running database migrations...")
     try:
         # Import and run migrations
-        import importlib.util
-        import os
-        from pathlib import Path
-
+        import migrations
         from migrations.migration_runner import migration_runner
 
-        # Load and add all migrations
-        migrations_dir = Path(__file__).parent / "migrations"
-        migration_files = sorted(
-            [
-                f
-                for f in os.listdir(migrations_dir)
-                if f.endswith(".py") and f[0].isdigit()
-            ]
+        # Load and add all migrations as regular package modules so that
+        # compiled bytecode from __pycache__ is reused between restarts
+        migration_modules = sorted(
+            module_info.name
+            for module_info in pkgutil.iter_modules(migrations.__path__)
+            if module_info.name[0].isdigit()
         )
 
-        for migration_file in migration_files:
-            migration_path = migrations_dir / migration_file
+        for module_name in migration_modules:
             try:
-                # Load migration from file
-                spec = importlib.util.spec_from_file_location(
-                    "migration", migration_path
-                )
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-
-                # Extract migration number from filename
-                migration_number = migration_file.split("_")[0]
+                module = importlib.import_module(f"migrations.{module_name}")
+
+                # Extract migration number from module name
+                migration_number = module_name.split("_")[0]
                 migration_attr = f"migration_{migration_number}"
 
                 migration = getattr(module, migration_attr)
                 migration_runner.add_migration(migration)
-                print(f"📦 Loaded migration: {migration_file}")
+                print(f"📦 Loaded migration: {module_name}")
             except Exception as e:
-                print(f"❌ Failed to load migration {migration_file}: {e}")
+                print(f"❌ Failed to load migration {module_name}: {e}")
 
         # Run migrations
         await migration_runner.run_migrations()
@@ -182,7 +163,11 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            # libuv-based event loop with lower per-callback overhead
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\n🛑 Startup interrupted by user")
         sys.exit(0)
@@ -5,7 +5,7 @@ Migration 001: Add synonyms field to countries table
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from migrations.migration_runner import Migration
+from migrations.migration_runner import Migration, column_exists
 
 
 class AddCountrySynonymsMigration(Migration):
@@ -19,16 +19,7 @@ class AddCountrySynonymsMigration(Migration):
     async def up(self, session: AsyncSession) -> None:
         """Add synonyms column to countries table"""
         # Check if synonyms column already exists
-        result = await session.execute(
-            text(
-                """
-            PRAGMA table_info(countries)
-        """
-            )
-        )
-        columns = [row[1] for row in result.fetchall()]
-
-        if "synonyms" not in columns:
+        if not await column_exists(session, "countries", "synonyms"):
             # Add synonyms column as JSON with default empty list
             await session.execute(
                 text(
@@ -38,7 +29,6 @@ class AddCountrySynonymsMigration(Migration):
             """
                 )
             )
-            await session.commit()
             print("Added synonyms column to countries table")
         else:
             print("Synonyms column already exists, skipping")
@@ -5,7 +5,7 @@ Migration 002: Add max_population field to games table
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from migrations.migration_runner import Migration
+from migrations.migration_runner import Migration, column_exists
 
 
 class AddMaxPopulationMigration(Migration):
@@ -19,10 +19,7 @@ class AddMaxPopulationMigration(Migration):
     async def up(self, session: AsyncSession) -> None:
         """Add max_population column to games table"""
         # Check if column already exists
-        result = await session.execute(text("PRAGMA table_info(games)"))
-        columns = [row[1] for row in result.fetchall()]
-
-        if "max_population" not in columns:
+        if not await column_exists(session, "games", "max_population"):
             await session.execute(
                 text(
                     """
@@ -31,7 +28,6 @@ class AddMaxPopulationMigration(Migration):
             """
                 )
             )
-            await session.commit()
             print("Added max_population column to games table")
         else:
             print("max_population column already exists, skipping")
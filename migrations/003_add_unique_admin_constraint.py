@@ -23,12 +23,16 @@ class AddUniqueAdminConstraintMigration(Migration):
             text(
                 """
             DELETE FROM players
-            WHERE id NOT IN (
-                SELECT MIN(id)
-                FROM players
-                WHERE role = 'admin'
-                GROUP BY telegram_id
-            ) AND role = 'admin'
+            WHERE id IN (
+                SELECT id FROM (
+                    SELECT
+                        id,
+                        ROW_NUMBER() OVER (PARTITION BY telegram_id ORDER BY id) AS rn
+                    FROM players
+                    WHERE role = 'admin'
+                )
+                WHERE rn > 1
+            )
         """
             )
         )
@@ -43,7 +47,6 @@ class AddUniqueAdminConstraintMigration(Migration):
         """
             )
         )
-        await session.commit()
 
         print("Added unique constraint for admin players")
 
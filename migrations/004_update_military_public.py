@@ -19,12 +19,19 @@ class UpdateMilitaryPublicMigration(Migration):
 
     async def up(self, session: AsyncSession) -> None:
         """Update military_public to True for all existing countries"""
+        # Skip the UPDATE (and its write lock) when every country is already public
+        result = await session.execute(
+            text("SELECT 1 FROM countries WHERE military_public = false LIMIT 1")
+        )
+        if result.scalar() is None:
+            print("✅ military_public is already True for all countries")
+            return
+
         await session.execute(
             text(
                 "UPDATE countries SET military_public = true WHERE military_public = false"
             )
         )
-        await session.commit()
         print("✅ Updated military_public to True for existing countries")
 
     async def down(self, session: AsyncSession) -> None:
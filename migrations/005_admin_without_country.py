@@ -5,13 +5,21 @@ This migration ensures that:
 1. Admin players can have NULL country_id
 2. Only player role requires a country
 3. Supports both user and chat admins (negative telegram_id for chats)
+
+Set MIGRATION_VERBOSE to 1, true or yes (in any case) to print player
+statistics by role while it runs; any other value leaves them off.
 """
 
+import os
+
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from migrations.migration_runner import Migration
 
+# Values of MIGRATION_VERBOSE that turn the player statistics on
+VERBOSE_VALUES = {"1", "true", "yes"}
+
 
 class AdminWithoutCountryMigration(Migration):
     """Allow admins to exist without countries"""
@@ -33,6 +41,11 @@ class AdminWithoutCountryMigration(Migration):
 
         # This migration is informational - the schema already supports NULL country_id
         # We're documenting that admins are allowed to not have countries
+        # Player statistics are only gathered on request, as they scan the whole table
+        if os.getenv("MIGRATION_VERBOSE", "").lower() not in VERBOSE_VALUES:
+            print("Schema already allows NULL country_id, nothing to change")
+            print("Migration 005 completed successfully")
+            return
 
         # Verify that admin players can exist without countries
         result = await session.execute(
@@ -64,7 +77,6 @@ class AdminWithoutCountryMigration(Migration):
                 f"  {row.role}: {row.count} total, {row.without_country} without country"
             )
 
-        await session.commit()
         print("Migration 005 completed successfully")
 
     async def down(self, session: AsyncSession) -> None:
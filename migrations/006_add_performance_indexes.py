@@ -8,6 +8,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from migrations.migration_runner import Migration
 
+# Index name -> indexed table and columns
+PERFORMANCE_INDEXES = {
+    # Most frequently queried field
+    "idx_players_telegram_id": "players(telegram_id)",
+    # Game-related queries
+    "idx_players_game_id": "players(game_id)",
+    # Admin checks
+    "idx_players_role": "players(role)",
+    # Message queries
+    "idx_messages_player_id": "messages(player_id)",
+    # Game-related message queries
+    "idx_messages_game_id": "messages(game_id)",
+    # Time-based queries
+    "idx_messages_created_at": "messages(created_at)",
+    # Filtering messages
+    "idx_messages_is_admin_reply": "messages(is_admin_reply)",
+}
+
 
 class PerformanceIndexesMigration(Migration):
     """Add indexes for performance optimization"""
@@ -22,109 +40,27 @@ class PerformanceIndexesMigration(Migration):
         """Add indexes for performance optimization"""
         print("Running migration 006: Add performance indexes")
 
-        # Add index on players.telegram_id (most frequently queried field)
-        await session.execute(
-            text(
-                """
-            CREATE INDEX IF NOT EXISTS idx_players_telegram_id
-            ON players(telegram_id)
-            """
-            )
-        )
-        print("✅ Added index on players.telegram_id")
-
-        # Add index on players.game_id (for game-related queries)
-        await session.execute(
-            text(
-                """
-            CREATE INDEX IF NOT EXISTS idx_players_game_id
-            ON players(game_id)
-            """
-            )
-        )
-        print("✅ Added index on players.game_id")
-
-        # Add index on players.role (for admin checks)
-        await session.execute(
-            text(
-                """
-            CREATE INDEX IF NOT EXISTS idx_players_role
-            ON players(role)
-            """
+        # The statements are independent, but SQLite allows a single writer,
+        # so they are issued one after another on the same session
+        for index_name, target in PERFORMANCE_INDEXES.items():
+            await session.execute(
+                text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {target}")
             )
-        )
-        print("✅ Added index on players.role")
 
-        # Add composite index for common query pattern (telegram_id + role)
-        await session.execute(
-            text(
-                """
-            CREATE INDEX IF NOT EXISTS idx_players_telegram_id_role
-            ON players(telegram_id, role)
-            """
-            )
-        )
-        print("✅ Added composite index on players(telegram_id, role)")
+        # Collect statistics so the query planner can weigh the new indexes
+        # (empty tables get no statistics, so fresh databases are unaffected)
+        await session.execute(text("ANALYZE players"))
+        await session.execute(text("ANALYZE messages"))
 
-        # Add index on messages.player_id for message queries
-        await session.execute(
-            text(
-                """
-            CREATE INDEX IF NOT EXISTS idx_messages_player_id
-            ON messages(player_id)
-            """
-            )
-        )
-        print("✅ Added index on messages.player_id")
-
-        # Add index on messages.game_id for game-related message queries
-        await session.execute(
-            text(
-                """
-            CREATE INDEX IF NOT EXISTS idx_messages_game_id
-            ON messages(game_id)
-            """
-            )
-        )
-        print("✅ Added index on messages.game_id")
-
-        # Add index on messages.created_at for time-based queries
-        await session.execute(
-            text(
-                """
-            CREATE INDEX IF NOT EXISTS idx_messages_created_at
-            ON messages(created_at)
-            """
-            )
-        )
-        print("✅ Added index on messages.created_at")
-
-        # Add index on messages.is_admin_reply for filtering messages
-        await session.execute(
-            text(
-                """
-            CREATE INDEX IF NOT EXISTS idx_messages_is_admin_reply
-            ON messages(is_admin_reply)
-            """
-            )
-        )
-        print("✅ Added index on messages.is_admin_reply")
-
-        await session.commit()
+        print(f"✅ Added {len(PERFORMANCE_INDEXES)} indexes on players and messages")
         print("Migration 006 completed successfully")
 
     async def down(self, session: AsyncSession) -> None:
         """Remove performance indexes"""
         print("Downgrading migration 006: Remove performance indexes")
 
-        await session.execute(text("DROP INDEX IF EXISTS idx_players_telegram_id"))
-        await session.execute(text("DROP INDEX IF EXISTS idx_players_game_id"))
-        await session.execute(text("DROP INDEX IF EXISTS idx_players_role"))
-        await session.execute(text("DROP INDEX IF EXISTS idx_players_telegram_id_role"))
-        await session.execute(text("DROP INDEX IF EXISTS idx_messages_player_id"))
-        await session.execute(text("DROP INDEX IF EXISTS idx_messages_game_id"))
-        await session.execute(text("DROP INDEX IF EXISTS idx_messages_created_at"))
-        await session.execute(text("DROP INDEX IF EXISTS idx_messages_is_admin_reply"))
+        for index_name in PERFORMANCE_INDEXES:
+            await session.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
 
         await session.commit()
         print("Migration 006 downgrade completed")
@@ -35,7 +35,6 @@ class AddExamplesMigration(Migration):
         """
             )
         )
-        await session.commit()
 
     async def down(self, session: AsyncSession) -> None:
         """Drop examples table"""
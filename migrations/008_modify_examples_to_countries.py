@@ -5,7 +5,7 @@ Modify examples table to reference countries instead of storing text
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from migrations.migration_runner import Migration
+from migrations.migration_runner import Migration, column_exists
 
 
 class ModifyExamplesTableMigration(Migration):
@@ -19,6 +19,11 @@ class ModifyExamplesTableMigration(Migration):
 
     async def up(self, session: AsyncSession) -> None:
         """Modify examples table structure"""
+        # Databases created from the current models already have the new structure
+        if await column_exists(session, "examples", "country_id"):
+            print("Examples table already references countries, skipping")
+            return
+
         # SQLite doesn't support ALTER TABLE DROP COLUMN or ADD COLUMN with constraints easily
         # So we need to recreate the table
 
@@ -47,8 +52,6 @@ class ModifyExamplesTableMigration(Migration):
         # 3. Rename new table to examples
         await session.execute(text("ALTER TABLE examples_new RENAME TO examples"))
 
-        await session.commit()
-
     async def down(self, session: AsyncSession) -> None:
         """Rollback to old structure"""
         # Recreate old table structure
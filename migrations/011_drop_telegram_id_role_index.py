@@ -0,0 +1,48 @@
+"""
+Migration 011: Drop redundant composite index on players(telegram_id, role)
+telegram_id is unique, so lookups by telegram_id (with or without role) already
+use its unique index; the composite index only added write cost on players
+"""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from migrations.migration_runner import Migration
+
+
+class DropTelegramIdRoleIndexMigration(Migration):
+    """Drop redundant players(telegram_id, role) index"""
+
+    def __init__(self):
+        super().__init__(
+            version="011",
+            description="Drop redundant composite index on players(telegram_id, role)",
+        )
+
+    async def up(self, session: AsyncSession) -> None:
+        """Drop composite telegram_id + role index"""
+        print("Running migration 011: Drop redundant telegram_id + role index")
+
+        await session.execute(text("DROP INDEX IF EXISTS idx_players_telegram_id_role"))
+
+        print("Migration 011 completed successfully")
+
+    async def down(self, session: AsyncSession) -> None:
+        """Recreate composite telegram_id + role index"""
+        print("Downgrading migration 011: Recreate telegram_id + role index")
+
+        await session.execute(
+            text(
+                """
+                CREATE INDEX IF NOT EXISTS idx_players_telegram_id_role
+                ON players(telegram_id, role)
+                """
+            )
+        )
+
+        await session.commit()
+        print("Migration 011 downgrade completed")
+
+
+# Create migration instance
+migration_011 = DropTelegramIdRoleIndexMigration()
@@ -2,10 +2,75 @@
 Migration runner for database schema changes
 """
 
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from operator import attrgetter
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from wpg_engine.models.base import create_db_engine
+
+# Statements are built once so repeated runs reuse the same clause objects
+CREATE_MIGRATIONS_TABLE = text(
+    """
+    CREATE TABLE IF NOT EXISTS migrations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        version TEXT NOT NULL UNIQUE,
+        description TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+)
+SELECT_APPLIED_VERSIONS = text("SELECT version FROM migrations")
+INSERT_APPLIED_VERSION = text(
+    "INSERT INTO migrations (version, description) VALUES (:version, :description)"
+)
+
+
+# pysqlite defers BEGIN on its own and runs DDL outside of transactions:
+# switch the driver to autocommit and let SQLAlchemy emit BEGIN itself,
+# as recommended by the SQLAlchemy SQLite docs
+def disable_pysqlite_transactions(dbapi_conn, connection_record):
+    """Stop the driver from managing transactions"""
+    dbapi_conn.isolation_level = None
+
+
+def emit_begin(conn):
+    """Emit BEGIN when SQLAlchemy starts a transaction"""
+    conn.exec_driver_sql("BEGIN")
+
+
+def create_migration_engine() -> AsyncEngine:
+    """Create an engine whose transactions also cover DDL and savepoints
+
+    Only migrations use this setup: with it a transaction that reads and
+    then writes fails with "database is locked" if another connection
+    committed in between, which concurrent bot handlers must not hit.
+    """
+    migration_engine = create_db_engine()
+    if migration_engine.dialect.name == "sqlite":
+        event.listen(
+            migration_engine.sync_engine, "connect", disable_pysqlite_transactions
+        )
+        event.listen(migration_engine.sync_engine, "begin", emit_begin)
+    return migration_engine
+
 
-from wpg_engine.models.base import AsyncSessionLocal
+async def column_exists(session: AsyncSession, table: str, column: str) -> bool:
+    """Check if column exists in table"""
+    result = await session.execute(
+        text("SELECT 1 FROM pragma_table_info(:table) WHERE name = :column LIMIT 1"),
+        {"table": table, "column": column},
+    )
+    return result.scalar() is not None
+
+
+async def index_exists(session: AsyncSession, index: str) -> bool:
+    """Check if index exists"""
+    result = await session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = :index"),
+        {"index": index},
+    )
+    return result.scalar() is not None
 
 
 class Migration:
@@ -16,7 +81,7 @@ class Migration:
         self.description = description
 
     async def up(self, session: AsyncSession) -> None:
-        """Apply migration"""
+        """Apply migration (the runner commits it together with its version)"""
         raise NotImplementedError
 
     async def down(self, session: AsyncSession) -> None:
@@ -36,69 +101,78 @@ class MigrationRunner:
 
     async def create_migration_table(self, session: AsyncSession) -> None:
         """Create migrations table if it doesn't exist"""
-        await session.execute(
-            text(
-                """
-            CREATE TABLE IF NOT EXISTS migrations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                version TEXT NOT NULL UNIQUE,
-                description TEXT NOT NULL,
-                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """
-            )
-        )
+        await session.execute(CREATE_MIGRATIONS_TABLE)
         await session.commit()
 
-    async def get_applied_migrations(self, session: AsyncSession) -> list[str]:
-        """Get list of applied migration versions"""
-        result = await session.execute(
-            text("SELECT version FROM migrations ORDER BY version")
-        )
-        return [row[0] for row in result.fetchall()]
+    async def get_applied_migrations(self, session: AsyncSession) -> set[str]:
+        """Get set of applied migration versions"""
+        result = await session.execute(SELECT_APPLIED_VERSIONS)
+        return set(result.scalars())
 
     async def mark_migration_applied(
         self, session: AsyncSession, migration: Migration
     ) -> None:
-        """Mark migration as applied"""
+        """Mark migration as applied (committed by the caller)"""
         await session.execute(
-            text(
-                """
-            INSERT INTO migrations (version, description) VALUES (:version, :description)
-        """
-            ),
+            INSERT_APPLIED_VERSION,
             {"version": migration.version, "description": migration.description},
         )
-        await session.commit()
 
-    async def run_migrations(self) -> None:
-        """Run all pending migrations"""
-        async with AsyncSessionLocal() as session:
-            await self.create_migration_table(session)
-            applied_migrations = await self.get_applied_migrations(session)
+    async def run_migrations(self, session: AsyncSession | None = None) -> None:
+        """Run all pending migrations, on a dedicated engine unless a session is given
 
-            for migration in self.migrations:
-                if migration.version not in applied_migrations:
+        The runner commits on the session it works with, so any changes
+        already pending on a given session are committed along with the
+        migrations. Each migration runs in a savepoint, which also lets the
+        session be one joined to an outer transaction, as in tests.
+        """
+        if session is None:
+            migration_engine = create_migration_engine()
+            try:
+                async with AsyncSession(
+                    migration_engine, expire_on_commit=False
+                ) as session:
+                    await self._run(session)
+            finally:
+                await migration_engine.dispose()
+        else:
+            await self._run(session)
+
+    async def _run(self, session: AsyncSession) -> None:
+        """Apply pending migrations using the given session"""
+        await self.create_migration_table(session)
+        applied_migrations = await self.get_applied_migrations(session)
+
+        if all(m.version in applied_migrations for m in self.migrations):
+            print("All migrations already applied")
+            return
+
+        for migration in sorted(self.migrations, key=attrgetter("version")):
+            if migration.version not in applied_migrations:
+                print(
+                    f"Applying migration {migration.version}: {migration.description}"
+                )
+                # A savepoint scopes the migration: on failure only its own
+                # changes are undone, the session's transaction stays usable
+                savepoint = await session.begin_nested()
+                try:
+                    await migration.up(session)
+                except Exception as e:
+                    # If migration fails its changes are rolled back,
+                    # but we still mark it to avoid retry loops
+                    print(f"⚠️  Migration {migration.version} encountered an error: {e}")
                     print(
-                        f"Applying migration {migration.version}: {migration.description}"
+                        f"⚠️  Marking migration {migration.version} as applied to prevent retry loops"
                     )
-                    try:
-                        await migration.up(session)
-                        await self.mark_migration_applied(session, migration)
-                        print(f"Migration {migration.version} applied successfully")
-                    except Exception as e:
-                        # If migration fails but changes might have been partially applied,
-                        # we still mark it to avoid retry loops
-                        print(
-                            f"⚠️  Migration {migration.version} encountered an error: {e}"
-                        )
-                        print(
-                            f"⚠️  Marking migration {migration.version} as applied to prevent retry loops"
-                        )
-                        await session.rollback()
-                        await self.mark_migration_applied(session, migration)
+                    await savepoint.rollback()
                 else:
-                    print(f"Migration {migration.version} already applied, skipping")
+                    await savepoint.commit()
+                    print(f"Migration {migration.version} applied successfully")
+                # The migration and its version row are committed at once
+                await self.mark_migration_applied(session, migration)
+                await session.commit()
+            else:
+                print(f"Migration {migration.version} already applied, skipping")
 
 
 # Global migration runner instance
@@ -5,6 +5,8 @@ Check for duplicate telegram_id entries in the database
 
 import asyncio
 import sys
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 # Add project root to path
@@ -22,42 +24,38 @@ async def check_duplicates():
     async with AsyncSessionLocal() as session:
         print("🔍 Checking for duplicate telegram_id entries...")
 
-        # Get duplicate telegram_ids
+        # Get all players sharing a telegram_id in a single query
         result = await session.execute(
             text(
                 """
-                SELECT telegram_id, COUNT(*) as count
-                FROM players
-                WHERE telegram_id IS NOT NULL
-                GROUP BY telegram_id
-                HAVING COUNT(*) > 1
+                WITH duplicates AS (
+                    SELECT telegram_id
+                    FROM players
+                    WHERE telegram_id IS NOT NULL
+                    GROUP BY telegram_id
+                    HAVING COUNT(*) > 1
+                )
+                SELECT p.telegram_id, p.id, p.username, p.display_name, p.role,
+                       p.game_id, p.created_at
+                FROM players p
+                JOIN duplicates d ON p.telegram_id = d.telegram_id
+                ORDER BY p.telegram_id, p.id
                 """
             )
         )
-        duplicates = result.fetchall()
+        duplicates = [
+            (telegram_id, list(players))
+            for telegram_id, players in groupby(result.fetchall(), key=itemgetter(0))
+        ]
 
         if duplicates:
             print(f"\n⚠️  Found {len(duplicates)} telegram_id values with duplicates:\n")
 
-            for telegram_id, count in duplicates:
-                print(f"   telegram_id={telegram_id}: {count} entries")
-
-                # Get details of these players
-                players_result = await session.execute(
-                    text(
-                        """
-                        SELECT id, username, display_name, role, game_id, created_at
-                        FROM players
-                        WHERE telegram_id = :telegram_id
-                        ORDER BY id ASC
-                        """
-                    ),
-                    {"telegram_id": telegram_id},
-                )
-                players = players_result.fetchall()
+            for telegram_id, players in duplicates:
+                print(f"   telegram_id={telegram_id}: {len(players)} entries")
 
                 for player in players:
-                    id, username, display_name, role, game_id, created_at = player
+                    _, id, username, display_name, role, game_id, created_at = player
                     print(
                         f"      - id={id}, username={username}, display_name={display_name}, "
                         f"role={role}, game_id={game_id}, created_at={created_at}"
@@ -4,8 +4,8 @@ Run database migrations
 """
 
 import asyncio
-import importlib.util
-import os
+import importlib
+import pkgutil
 import sys
 from pathlib import Path
 
@@ -13,18 +13,16 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+import migrations  # noqa: E402
 from migrations.migration_runner import migration_runner  # noqa: E402
 
 
-def load_migration(file_path):
-    """Load migration from file"""
-    spec = importlib.util.spec_from_file_location("migration", file_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+def load_migration(module_name):
+    """Load migration from the migrations package"""
+    module = importlib.import_module(f"migrations.{module_name}")
 
-    # Extract migration number from filename (e.g., "001_add_country_synonyms.py" -> "001")
-    filename = Path(file_path).name
-    migration_number = filename.split("_")[0]
+    # Extract migration number from module name (e.g., "001_add_country_synonyms" -> "001")
+    migration_number = module_name.split("_")[0]
     migration_attr = f"migration_{migration_number}"
 
     return getattr(module, migration_attr)
@@ -34,20 +32,21 @@ async def main():
     """Run all migrations"""
     print("Starting database migrations...")
 
-    # Load and add all migrations
-    migrations_dir = project_root / "migrations"
-    migration_files = sorted(
-        [f for f in os.listdir(migrations_dir) if f.endswith(".py") and f[0].isdigit()]
+    # Load and add all migrations as regular package modules so that
+    # compiled bytecode from __pycache__ is reused between runs
+    migration_modules = sorted(
+        module_info.name
+        for module_info in pkgutil.iter_modules(migrations.__path__)
+        if module_info.name[0].isdigit()
     )
 
-    for migration_file in migration_files:
-        migration_path = migrations_dir / migration_file
+    for module_name in migration_modules:
         try:
-            migration = load_migration(migration_path)
+            migration = load_migration(module_name)
             migration_runner.add_migration(migration)
-            print(f"Loaded migration: {migration_file}")
+            print(f"Loaded migration: {module_name}")
         except Exception as e:
-            print(f"Failed to load migration {migration_file}: {e}")
+            print(f"Failed to load migration {module_name}: {e}")
 
     # Run migrations
     await migration_runner.run_migrations()
@@ -2,36 +2,43 @@
 Test configuration and fixtures
 """
 
-import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
+from wpg_engine.core.engine import GameEngine
 from wpg_engine.models.base import Base
 
 # Configure pytest-asyncio
 pytest_asyncio.asyncio_mode = "auto"
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture(scope="session")
 async def test_engine():
     """Create a test database engine"""
-    # Use in-memory SQLite for tests
+    # Use in-memory SQLite for tests; the whole run shares one connection,
+    # and with it one database
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
+        poolclass=StaticPool,
     )
 
-    # Create all tables
+    # pysqlite defers BEGIN on its own, which breaks SAVEPOINT handling:
+    # switch the driver to autocommit and let SQLAlchemy emit BEGIN itself
+    @event.listens_for(engine.sync_engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # Create all tables once for the whole test session
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -41,26 +48,43 @@ async def test_engine():
 
 
 @pytest.fixture(scope="session")
-async def test_session_factory(test_engine):
+async def test_session_factory():
     """Create a session factory for tests"""
-    return async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+    # Sessions join the per-test transaction: commit() only releases a
+    # SAVEPOINT, so everything a test writes is rolled back afterwards
+    return async_sessionmaker(
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
 
 
 @pytest.fixture
-async def db_session(test_session_factory):
-    """Create a database session for each test"""
-    async with test_session_factory() as session:
-        try:
+async def db_session(test_engine, test_session_factory):
+    """Create a database session whose changes are rolled back after each test"""
+    async with test_engine.connect() as conn:
+        await conn.begin()
+        async with test_session_factory(bind=conn) as session:
             yield session
-        finally:
-            await session.rollback()
-            await session.close()
+        await conn.rollback()
 
 
-@pytest.fixture(autouse=True)
-async def clean_database(test_engine):
-    """Clean database before each test"""
-    async with test_engine.begin() as conn:
-        # Drop and recreate all tables for each test
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+@pytest.fixture
+async def game_engine(db_session):
+    """Create a game engine bound to the test session"""
+    return GameEngine(db_session)
+
+
+@pytest.fixture(scope="session")
+def async_db_mock_factory():
+    """Build mocked database sessions with canned query results"""
+
+    def make(scalar=None, scalar_one_or_none=None):
+        db = MagicMock()
+        db.scalar = AsyncMock(return_value=scalar)
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = scalar_one_or_none
+        db.execute = AsyncMock(return_value=result)
+        return db
+
+    return make
@@ -2,9 +2,12 @@
 Tests for refactored admin functions
 """
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendMessage
 
 from wpg_engine.adapters.telegram.handlers.admin_utils import (
     extract_country_from_reply,
@@ -17,21 +20,15 @@ from wpg_engine.adapters.telegram.handlers.admin_utils import (
 @pytest.mark.asyncio
 async def test_find_target_country_by_name():
     """Test finding country by name and synonyms"""
-    # Create mock countries
-    country1 = MagicMock()
-    country1.name = "Российская Империя"
-    country1.synonyms = ["Россия", "РИ"]
-
-    country2 = MagicMock()
-    country2.name = "Британская Империя"
-    country2.synonyms = ["Британия", "Англия"]
-
-    # Create mock players
-    player1 = MagicMock()
-    player1.country = country1
+    # Create stand-in countries
+    country1 = SimpleNamespace(name="Российская Империя", synonyms=["Россия", "РИ"])
+    country2 = SimpleNamespace(
+        name="Британская Империя", synonyms=["Британия", "Англия"]
+    )
 
-    player2 = MagicMock()
-    player2.country = country2
+    # Create stand-in players
+    player1 = SimpleNamespace(country=country1)
+    player2 = SimpleNamespace(country=country2)
 
     players = [player1, player2]
 
@@ -66,24 +63,18 @@ async def test_find_target_country_by_name():
 @pytest.mark.asyncio
 async def test_extract_country_from_reply():
     """Test extracting country from reply message"""
-    # Create mock country
-    country = MagicMock()
-    country.id = 123
-    country.name = "Тестовая Страна"
-    country.synonyms = ["Тест"]
+    # Create stand-in country
+    country = SimpleNamespace(id=123, name="Тестовая Страна", synonyms=["Тест"])
 
-    # Create mock player
-    player = MagicMock()
-    player.country = country
+    # Create stand-in player
+    player = SimpleNamespace(country=country)
 
     players = [player]
 
     # Test with hidden marker
-    reply_message = MagicMock()
-    reply_message.text = "Some text [EDIT_COUNTRY:123] more text"
+    reply_message = SimpleNamespace(text="Some text [EDIT_COUNTRY:123] more text")
 
-    message = MagicMock()
-    message.reply_to_message = reply_message
+    message = SimpleNamespace(reply_to_message=reply_message)
 
     result = await extract_country_from_reply(message, players)
     assert result == (player, "Тестовая Страна")
@@ -108,14 +99,9 @@ async def test_send_message_to_players():
     # Create mock game engine
     game_engine = AsyncMock()
 
-    # Create mock players
-    player1 = MagicMock()
-    player1.id = 1
-    player1.telegram_id = 100
-
-    player2 = MagicMock()
-    player2.id = 2
-    player2.telegram_id = 200
+    # Create stand-in players
+    player1 = SimpleNamespace(id=1, telegram_id=100)
+    player2 = SimpleNamespace(id=2, telegram_id=200)
 
     players = [player1, player2]
 
@@ -143,10 +129,8 @@ async def test_send_message_to_players_with_markdown():
     # Create mock game engine
     game_engine = AsyncMock()
 
-    # Create mock player
-    player = MagicMock()
-    player.id = 1
-    player.telegram_id = 100
+    # Create stand-in player
+    player = SimpleNamespace(id=1, telegram_id=100)
 
     players = [player]
 
@@ -172,10 +156,8 @@ async def test_send_message_to_players_with_failure():
     # Create mock game engine
     game_engine = AsyncMock()
 
-    # Create mock player
-    player = MagicMock()
-    player.id = 1
-    player.telegram_id = 100
+    # Create stand-in player
+    player = SimpleNamespace(id=1, telegram_id=100)
 
     players = [player]
 
@@ -192,3 +174,84 @@ async def test_send_message_to_players_with_failure():
 
     # Verify game_engine.create_message was not called due to failure
     assert game_engine.create_message.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_send_message_to_players_with_partial_failure():
+    """Test that one failed delivery does not affect the other players"""
+    # Create mock bot that fails only for the second player
+    bot = AsyncMock()
+
+    async def send_message(chat_id, text, **kwargs):
+        if chat_id == 200:
+            raise Exception("Forbidden: bot was blocked by the user")
+
+    bot.send_message.side_effect = send_message
+
+    # Create mock game engine
+    game_engine = AsyncMock()
+
+    # Create stand-in players
+    player1 = SimpleNamespace(id=1, telegram_id=100)
+    player2 = SimpleNamespace(id=2, telegram_id=200)
+    player3 = SimpleNamespace(id=3, telegram_id=300)
+
+    players = [player1, player2, player3]
+
+    sent_count, failed_count = await send_message_to_players(
+        bot, game_engine, players, "Test message", 1, use_markdown=False
+    )
+
+    assert sent_count == 2
+    assert failed_count == 1
+
+    # Only delivered messages are saved, for the right players
+    saved_player_ids = [
+        call.kwargs["player_id"] for call in game_engine.create_message.call_args_list
+    ]
+    assert saved_player_ids == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_send_message_to_players_retries_after_flood_control():
+    """Test that a send rejected by flood control is retried after the delay"""
+    # Create mock bot that hits flood control once for the second player
+    bot = AsyncMock()
+    flood_waited = []
+
+    async def send_message(chat_id, text, **kwargs):
+        if chat_id == 200 and not flood_waited:
+            flood_waited.append(chat_id)
+            raise TelegramRetryAfter(
+                method=SendMessage(chat_id=chat_id, text=text),
+                message="Too Many Requests: retry after 3",
+                retry_after=3,
+            )
+
+    bot.send_message.side_effect = send_message
+
+    # Create mock game engine
+    game_engine = AsyncMock()
+
+    # Create stand-in players
+    players = [
+        SimpleNamespace(id=1, telegram_id=100),
+        SimpleNamespace(id=2, telegram_id=200),
+        SimpleNamespace(id=3, telegram_id=300),
+    ]
+
+    with patch(
+        "wpg_engine.adapters.telegram.handlers.admin_utils.asyncio.sleep",
+        new_callable=AsyncMock,
+    ) as mock_sleep:
+        sent_count, failed_count = await send_message_to_players(
+            bot, game_engine, players, "Test message", 1, use_markdown=True
+        )
+
+    assert sent_count == 3
+    assert failed_count == 0
+
+    # The bot waited for the requested delay and resent to the same player
+    mock_sleep.assert_awaited_once_with(3)
+    assert bot.send_message.call_count == 4
+    assert game_engine.create_message.call_count == 3
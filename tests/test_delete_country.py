@@ -5,7 +5,6 @@ Test delete country functionality
 import pytest
 from sqlalchemy import select
 
-from wpg_engine.core.engine import GameEngine
 from wpg_engine.models import Country, Player, PlayerRole
 
 
@@ -13,9 +12,8 @@ class TestDeleteCountry:
     """Test delete country functionality"""
 
     @pytest.mark.asyncio
-    async def test_delete_country_success(self, db_session):
+    async def test_delete_country_success(self, db_session, game_engine):
         """Test successful country deletion"""
-        game_engine = GameEngine(db_session)
 
         # Create a game first
         game = await game_engine.create_game(
@@ -85,9 +83,8 @@ class TestDeleteCountry:
         assert unassigned_player.country_id is None
 
     @pytest.mark.asyncio
-    async def test_delete_nonexistent_country(self, db_session):
+    async def test_delete_nonexistent_country(self, game_engine):
         """Test deleting a non-existent country"""
-        game_engine = GameEngine(db_session)
 
         # Try to delete a country that doesn't exist
         success = await game_engine.delete_country(99999)
@@ -3,18 +3,11 @@
 """
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from wpg_engine.core.engine import GameEngine
 from wpg_engine.models import Game, PlayerRole
 
 
-@pytest.fixture
-async def game_engine(db_session: AsyncSession):
-    """Создать экземпляр игрового движка"""
-    return GameEngine(db_session)
-
-
 @pytest.fixture
 async def test_game(game_engine: GameEngine):
     """Создать тестовую игру"""
@@ -5,18 +5,11 @@ Tests for message statistics functionality
 from datetime import datetime, timedelta, timezone
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from wpg_engine.core.engine import GameEngine
 from wpg_engine.models import PlayerRole
 
 
-@pytest.fixture
-async def game_engine(db_session: AsyncSession):
-    """Create a game engine instance"""
-    return GameEngine(db_session)
-
-
 @pytest.fixture
 async def test_game(game_engine: GameEngine):
     """Create a test game"""
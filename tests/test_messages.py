@@ -3,16 +3,11 @@ Tests for the message system
 """
 
 import pytest
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from wpg_engine.core.engine import GameEngine
-from wpg_engine.models import Player, PlayerRole
-
-
-@pytest.fixture
-async def game_engine(db_session: AsyncSession):
-    """Create a game engine instance"""
-    return GameEngine(db_session)
+from wpg_engine.models import Message, Player, PlayerRole
 
 
 @pytest.fixture
@@ -113,22 +108,27 @@ class TestMessageSystem:
         assert admin_reply.content == "Admin response"
 
     async def test_get_player_messages(
-        self, game_engine: GameEngine, regular_player: Player, test_game
+        self,
+        db_session: AsyncSession,
+        game_engine: GameEngine,
+        regular_player: Player,
+        test_game,
     ):
         """Test retrieving player messages"""
-        import asyncio
-
-        # Create multiple messages with small delays to ensure different timestamps
-        messages = []
-        for i in range(5):
-            message = await game_engine.create_message(
-                player_id=regular_player.id,
-                game_id=test_game.id,
-                content=f"Test message {i + 1}",
-                is_admin_reply=False,
-            )
-            messages.append(message)
-            await asyncio.sleep(0.01)  # Small delay to ensure different timestamps
+        # Seed history in one executemany; ties on created_at are ordered by id
+        await db_session.execute(
+            insert(Message),
+            [
+                {
+                    "player_id": regular_player.id,
+                    "game_id": test_game.id,
+                    "content": f"Test message {i + 1}",
+                    "is_admin_reply": False,
+                }
+                for i in range(5)
+            ],
+        )
+        await db_session.commit()
 
         # Get player messages (should return in reverse chronological order)
         retrieved_messages = await game_engine.get_player_messages(
@@ -141,20 +141,27 @@ class TestMessageSystem:
         assert retrieved_messages[4].content == "Test message 1"
 
     async def test_get_player_messages_limit(
-        self, game_engine: GameEngine, regular_player: Player, test_game
+        self,
+        db_session: AsyncSession,
+        game_engine: GameEngine,
+        regular_player: Player,
+        test_game,
     ):
         """Test retrieving player messages with limit"""
-        import asyncio
-
-        # Create 15 messages with small delays to ensure different timestamps
-        for i in range(15):
-            await game_engine.create_message(
-                player_id=regular_player.id,
-                game_id=test_game.id,
-                content=f"Message {i + 1}",
-                is_admin_reply=False,
-            )
-            await asyncio.sleep(0.01)  # Small delay to ensure different timestamps
+        # Seed 15 messages in one executemany
+        await db_session.execute(
+            insert(Message),
+            [
+                {
+                    "player_id": regular_player.id,
+                    "game_id": test_game.id,
+                    "content": f"Message {i + 1}",
+                    "is_admin_reply": False,
+                }
+                for i in range(15)
+            ],
+        )
+        await db_session.commit()
 
         # Get only last 10 messages
         retrieved_messages = await game_engine.get_player_messages(
@@ -0,0 +1,56 @@
+"""
+Tests for the migration runner
+"""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from migrations.migration_runner import Migration, MigrationRunner, column_exists
+
+
+class AddNoteMigration(Migration):
+    """Migration that adds a column to games"""
+
+    def __init__(self):
+        super().__init__("900", "Add note to games")
+
+    async def up(self, session: AsyncSession) -> None:
+        await session.execute(text("ALTER TABLE games ADD COLUMN note TEXT"))
+
+
+class FailingMigration(Migration):
+    """Migration that fails halfway through"""
+
+    def __init__(self):
+        super().__init__("901", "Broken migration")
+
+    async def up(self, session: AsyncSession) -> None:
+        await session.execute(text("ALTER TABLE games ADD COLUMN broken TEXT"))
+        raise RuntimeError("boom")
+
+
+class TestMigrationRunner:
+    """Tests for MigrationRunner with an injected session"""
+
+    async def test_run_migrations_with_session(self, db_session: AsyncSession):
+        """Pending migrations are applied once using the given session"""
+        runner = MigrationRunner()
+        runner.add_migration(AddNoteMigration())
+
+        await runner.run_migrations(db_session)
+        await runner.run_migrations(db_session)
+
+        assert await column_exists(db_session, "games", "note")
+        applied = await runner.get_applied_migrations(db_session)
+        assert "900" in applied
+
+    async def test_failed_migration_is_rolled_back(self, db_session: AsyncSession):
+        """A failing migration leaves no changes but is still marked applied"""
+        runner = MigrationRunner()
+        runner.add_migration(FailingMigration())
+
+        await runner.run_migrations(db_session)
+
+        assert not await column_exists(db_session, "games", "broken")
+        applied = await runner.get_applied_migrations(db_session)
+        assert "901" in applied
@@ -1,44 +1,22 @@
-#!/usr/bin/env python3
 """
-Test script for /random command
+Tests for /random command
 """
 
-import asyncio
 from unittest.mock import patch
 
 import pytest
 from aiogram.types import User
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from wpg_engine.adapters.telegram.handlers.admin_commands import random_command
 from wpg_engine.core.engine import GameEngine
 from wpg_engine.models import PlayerRole
-from wpg_engine.models.base import Base
-
-
-@pytest.fixture
-async def test_db():
-    """Create test database"""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-
-    # Create tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    # Create session
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-    async with async_session() as session:
-        yield session
-
-    await engine.dispose()
 
 
 @pytest.mark.asyncio
-async def test_random_command_returns_percentage(test_db: AsyncSession):
+async def test_random_command_returns_percentage(db_session: AsyncSession):
     """Test that /random command returns a percentage between 0 and 100"""
-    game_engine = GameEngine(test_db)
+    game_engine = GameEngine(db_session)
 
     # Create a test game
     game = await game_engine.create_game(
@@ -105,13 +83,11 @@ async def test_random_command_returns_percentage(test_db: AsyncSession):
             "Random command should produce varied results"
         )
 
-        print(f"✅ Random command test passed! Generated values: {results}")
-
 
 @pytest.mark.asyncio
-async def test_random_command_non_admin_denied(test_db: AsyncSession):
+async def test_random_command_non_admin_denied(db_session: AsyncSession):
     """Test that non-admin users cannot use /random command"""
-    game_engine = GameEngine(test_db)
+    game_engine = GameEngine(db_session)
 
     # Create a test game
     game = await game_engine.create_game(
@@ -158,10 +134,3 @@ async def test_random_command_non_admin_denied(test_db: AsyncSession):
         assert mock_message._answer_text is not None
         assert "❌" in mock_message._answer_text
         assert "прав администратора" in mock_message._answer_text
-
-        print("✅ Non-admin access denied test passed!")
-
-
-if __name__ == "__main__":
-    asyncio.run(test_random_command_returns_percentage())
-    asyncio.run(test_random_command_non_admin_denied())
@@ -2,8 +2,11 @@
 Admin handlers utilities
 """
 
+import asyncio
+import logging
 import re
 
+from aiogram.exceptions import TelegramRetryAfter
 from aiogram.fsm.state import State, StatesGroup
 from telegramify_markdown import markdownify
 
@@ -11,6 +14,18 @@ from wpg_engine.adapters.telegram.utils import escape_html
 from wpg_engine.core.engine import GameEngine
 from wpg_engine.models import Country, Player
 
+logger = logging.getLogger(__name__)
+
+# Upper bound on Telegram requests in flight during a broadcast
+MAX_CONCURRENT_SENDS = 25
+# Attempts per player when Telegram asks to wait because of flood control
+MAX_SEND_ATTEMPTS = 3
+
+# Hidden marker with the country id, appended to admin-facing messages
+EDIT_COUNTRY_MARKER_RE = re.compile(r"\[EDIT_COUNTRY:(\d+)\]")
+# Country name heading in the format "🏛️ <b>Country Name</b>"
+COUNTRY_HEADING_RE = re.compile(r"🏛️\s*<b>([^<]+)</b>")
+
 
 class AdminStates(StatesGroup):
     """Admin states"""
@@ -24,20 +39,21 @@ class AdminStates(StatesGroup):
     waiting_for_example_message = State()
 
 
+def _country_matches(country: Country, folded_name: str) -> bool:
+    """Check a country's official name and synonyms against a casefolded name"""
+    if country.name.casefold() == folded_name:
+        return True
+    return any(synonym.casefold() == folded_name for synonym in country.synonyms or ())
+
+
 async def find_target_country_by_name(
     all_countries: list[Country], country_name: str
 ) -> Country | None:
     """Find target country by name or synonyms (case-insensitive)"""
+    folded_name = country_name.casefold()
     for country in all_countries:
-        # Check official name
-        if country.name.lower() == country_name.lower():
+        if _country_matches(country, folded_name):
             return country
-
-        # Check synonyms
-        if country.synonyms:
-            for synonym in country.synonyms:
-                if synonym.lower() == country_name.lower():
-                    return country
     return None
 
 
@@ -45,19 +61,10 @@ async def find_target_player_by_country_name(
     all_players: list[Player], country_name: str
 ) -> Player | None:
     """Find target player by their country name or synonyms (case-insensitive)"""
+    folded_name = country_name.casefold()
     for player in all_players:
-        if not player.country:
-            continue
-
-        # Check official name
-        if player.country.name.lower() == country_name.lower():
+        if player.country and _country_matches(player.country, folded_name):
             return player
-
-        # Check synonyms
-        if player.country.synonyms:
-            for synonym in player.country.synonyms:
-                if synonym.lower() == country_name.lower():
-                    return player
     return None
 
 
@@ -84,7 +91,7 @@ async def extract_country_from_reply(
     )
 
     # Look for the hidden marker [EDIT_COUNTRY:id]
-    country_id_match = re.search(r"\[EDIT_COUNTRY:(\d+)\]", replied_text)
+    country_id_match = EDIT_COUNTRY_MARKER_RE.search(replied_text)
     if country_id_match:
         country_id = int(country_id_match.group(1))
 
@@ -100,7 +107,7 @@ async def extract_country_from_reply(
 
     # If no hidden marker found, try to extract country name from the message
     # Look for country name in the format "🏛️ **Country Name**"
-    country_name_match = re.search(r"🏛️\s*<b>([^<]+)</b>", replied_text)
+    country_name_match = COUNTRY_HEADING_RE.search(replied_text)
     if country_name_match:
         extracted_country_name = country_name_match.group(1).strip()
 
@@ -121,6 +128,36 @@ async def extract_country_from_reply(
     return None
 
 
+async def _send_to_player(
+    bot, player: Player, message_content: str, use_markdown: bool
+) -> None:
+    """Send message to a single player, falling back to HTML if markdown fails"""
+    if use_markdown:
+        # Try to format with markdownify first
+        try:
+            formatted_message = markdownify(message_content)
+            await bot.send_message(
+                player.telegram_id,
+                formatted_message,
+                parse_mode="MarkdownV2",
+            )
+            return
+        except TelegramRetryAfter:
+            # Flood control is not a formatting problem, let the caller wait
+            raise
+        except Exception as format_error:
+            logger.warning(
+                f"⚠️ Не удалось отправить форматированное сообщение игроку {player.telegram_id}: {format_error}"
+            )
+            # Fallback to HTML
+
+    await bot.send_message(
+        player.telegram_id,
+        escape_html(message_content),
+        parse_mode="HTML",
+    )
+
+
 async def send_message_to_players(
     bot,
     game_engine: GameEngine,
@@ -131,43 +168,40 @@ async def send_message_to_players(
 ) -> tuple[int, int]:
     """Send message to multiple players
 
+    Telegram requests run concurrently, while the messages are saved to
+    the database one by one since they share the game engine session.
+    Sends rejected by flood control are retried after the requested delay.
+
     Returns:
         Tuple of (sent_count, failed_count)
     """
-    import logging
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
 
-    logger = logging.getLogger(__name__)
+    async def send(player: Player) -> None:
+        async with semaphore:
+            for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+                try:
+                    await _send_to_player(bot, player, message_content, use_markdown)
+                    return
+                except TelegramRetryAfter as e:
+                    if attempt == MAX_SEND_ATTEMPTS:
+                        raise
+                    logger.warning(
+                        f"⏳ Flood control для игрока {player.telegram_id}, повтор через {e.retry_after} с"
+                    )
+                    await asyncio.sleep(e.retry_after)
+
+    results = await asyncio.gather(
+        *(send(player) for player in players), return_exceptions=True
+    )
 
     sent_count = 0
     failed_count = 0
 
-    for player in players:
+    for player, result in zip(players, results, strict=True):
         try:
-            if use_markdown:
-                # Try to format with markdownify first
-                try:
-                    formatted_message = markdownify(message_content)
-                    await bot.send_message(
-                        player.telegram_id,
-                        formatted_message,
-                        parse_mode="MarkdownV2",
-                    )
-                except Exception as format_error:
-                    logger.warning(
-                        f"⚠️ Не удалось отправить форматированное сообщение игроку {player.telegram_id}: {format_error}"
-                    )
-                    # Fallback to HTML
-                    await bot.send_message(
-                        player.telegram_id,
-                        escape_html(message_content),
-                        parse_mode="HTML",
-                    )
-            else:
-                await bot.send_message(
-                    player.telegram_id,
-                    escape_html(message_content),
-                    parse_mode="HTML",
-                )
+            if isinstance(result, BaseException):
+                raise result
             sent_count += 1
 
             # Save the admin message to database for RAG context
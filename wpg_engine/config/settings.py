@@ -17,6 +17,9 @@ class DatabaseSettings(BaseSettings):
 
     url: str = Field(default="sqlite:///./wpg_engine.db", description="Database URL")
     echo: bool = Field(default=False, description="Echo SQL queries")
+    timeout: float = Field(
+        default=5, description="SQLite busy timeout in seconds for locked database"
+    )
 
     model_config = SettingsConfigDict(env_prefix="DB_", extra="allow")
 
@@ -49,17 +49,15 @@ async def determine_player_role(
     if is_admin_chat(chat_id):
         return PlayerRole.ADMIN
 
-    # Check if this is the first player in the game
-    result = await db.execute(select(Player).where(Player.game_id == game_id))
-    existing_players = result.scalars().all()
-
-    # If no players exist, make this user admin
-    if not existing_players:
-        return PlayerRole.ADMIN
-
-    # Check if there are any admins in the game
-    admins = [p for p in existing_players if p.role == PlayerRole.ADMIN]
-    if not admins:
+    # First player in the game (or any player while the game has no admin)
+    # becomes admin; only look up whether a single admin exists
+    admin_id = await db.scalar(
+        select(Player.id)
+        .where(Player.game_id == game_id)
+        .where(Player.role == PlayerRole.ADMIN)
+        .limit(1)
+    )
+    if admin_id is None:
         return PlayerRole.ADMIN
 
     # Default role is player
@@ -6,8 +6,13 @@ import sqlite3
 from contextlib import asynccontextmanager
 from datetime import datetime
 
-from sqlalchemy import DateTime, event, func
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import DateTime, event, func, inspect
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.pool import NullPool
 
@@ -35,22 +40,7 @@ class Base(DeclarativeBase):
     )
 
 
-# Database engine with proper async configuration
-# Use NullPool to avoid connection pool issues with SQLite
-# Each request gets a fresh connection that's properly closed
-engine = create_async_engine(
-    settings.database.url.replace("sqlite://", "sqlite+aiosqlite://"),
-    echo=settings.database.echo,
-    poolclass=NullPool,  # No connection pooling - fresh connection each time
-    connect_args={
-        "check_same_thread": False,  # Allow sharing connection across threads
-        "timeout": 5,  # Reduced timeout for busy database operations (5 seconds)
-    },
-)
-
-
 # Enable WAL mode and optimize SQLite for concurrent access
-@event.listens_for(engine.sync_engine, "connect")
 def set_sqlite_pragma(dbapi_conn, connection_record):
     """Set SQLite pragmas for better concurrent performance"""
     cursor = dbapi_conn.cursor()
@@ -58,15 +48,43 @@ def set_sqlite_pragma(dbapi_conn, connection_record):
     cursor.execute("PRAGMA journal_mode=WAL")
     # Reduce synchronous commits for better performance (still safe with WAL)
     cursor.execute("PRAGMA synchronous=NORMAL")
+    # Keep temporary tables and indices in memory
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    # Memory-map up to 256MB of the database file
+    cursor.execute("PRAGMA mmap_size=268435456")
     # Increase cache size to 64MB
     cursor.execute("PRAGMA cache_size=-64000")
     # Enable foreign keys
     cursor.execute("PRAGMA foreign_keys=ON")
-    # Set busy timeout to 5 seconds (reduced from 60s to prevent long waits)
-    cursor.execute("PRAGMA busy_timeout=5000")
     cursor.close()
 
 
+def create_db_engine() -> AsyncEngine:
+    """Create a database engine configured from the database settings"""
+    # Use NullPool to avoid connection pool issues with SQLite
+    # Each request gets a fresh connection that's properly closed
+    db_engine = create_async_engine(
+        settings.database.url.replace("sqlite://", "sqlite+aiosqlite://"),
+        echo=settings.database.echo,
+        poolclass=NullPool,  # No connection pooling - fresh connection each time
+        connect_args={
+            "check_same_thread": False,  # Allow sharing connection across threads
+            # Busy timeout for locked database, also sets PRAGMA busy_timeout
+            "timeout": settings.database.timeout,
+        },
+    )
+
+    # PRAGMAs are SQLite-specific, other backends keep their defaults
+    if db_engine.dialect.name == "sqlite":
+        event.listen(db_engine.sync_engine, "connect", set_sqlite_pragma)
+
+    return db_engine
+
+
+# Database engine with proper async configuration
+engine = create_db_engine()
+
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -101,7 +119,28 @@ async def get_db():
         await session.close()
 
 
-async def init_db() -> None:
-    """Initialize database tables"""
+async def init_db() -> list[str]:
+    """
+    Initialize database tables.
+
+    The schema is introspected once and only missing tables are created,
+    all within a single transaction.
+
+    Returns:
+        Names of the tables that were created
+    """
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        existing_tables = await conn.run_sync(
+            lambda sync_conn: set(inspect(sync_conn).get_table_names())
+        )
+        missing_tables = [
+            table
+            for table in Base.metadata.sorted_tables
+            if table.name not in existing_tables
+        ]
+        if missing_tables:
+            await conn.run_sync(
+                Base.metadata.create_all, tables=missing_tables, checkfirst=False
+            )
+
+    return [table.name for table in missing_tables]